@@ -1,9 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import literal
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.db.session import get_db
 from app.models.news import NewsItem, Source
-from app.schemas.news import NewsItemResponse
+from app.schemas.news import NewsItemResponse, NewsSearchResult
+from app.services.search import search_news
+from app.services.hot_store import hot_store
 from pydantic import BaseModel
 
 router = APIRouter()
@@ -29,21 +32,42 @@ def get_sources(db: Session = Depends(get_db)):
     sources = db.query(Source).all()
     return [SourceResponse(id=s.id, name=s.name, url=s.url, is_active=bool(s.is_active)) for s in sources]
 
-@router.get("/news", response_model=List[NewsItemResponse])
-def get_news(
-    db: Session = Depends(get_db),
+def query_recent_news(
+    db: Session,
     limit: int = 100,
     category: Optional[str] = None,
-    impact: Optional[str] = None
-):
+    impact: Optional[str] = None,
+    ticker: Optional[str] = None
+) -> List[NewsItem]:
+    """DB side of GET /news; must answer exactly like hot_store.query"""
     query = db.query(NewsItem)
     
     if category:
         query = query.filter(NewsItem.category == category)
     if impact:
         query = query.filter(NewsItem.impact_score == impact)
-        
-    items = query.order_by(NewsItem.published_at.desc()).limit(limit).all()
+    if ticker:
+        # Exact ticker in the comma-separated list, same as the hot store's index
+        padded = literal(",") + NewsItem.companies + literal(",")
+        query = query.filter(padded.contains(f",{ticker.upper()},", autoescape=True))
+    
+    # Ties broken by id, like the hot store's (published_at, id) order
+    return query.order_by(NewsItem.published_at.desc(), NewsItem.id.desc()).limit(limit).all()
+
+@router.get("/news", response_model=List[NewsItemResponse])
+def get_news(
+    db: Session = Depends(get_db),
+    limit: int = 100,
+    category: Optional[str] = None,
+    impact: Optional[str] = None,
+    ticker: Optional[str] = None
+):
+    # Recent items are answered from memory, without touching the DB
+    records = hot_store.query(limit=limit, category=category, impact=impact, ticker=ticker)
+    if records is not None:
+        return [record.as_dict() for record in records]
+    
+    items = query_recent_news(db, limit=limit, category=category, impact=impact, ticker=ticker)
     
     # Convert to response format
     results = []
@@ -64,3 +88,34 @@ def get_news(
         })
         
     return results
+
+@router.get("/news/search", response_model=List[NewsSearchResult])
+def search(
+    q: str = Query(..., min_length=2, max_length=200),
+    db: Session = Depends(get_db),
+    limit: int = Query(20, ge=1, le=100),
+    category: Optional[str] = None,
+    impact: Optional[str] = None
+):
+    hits = search_news(db, q, limit=limit, category=category, impact=impact)
+    
+    results = []
+    for item, rank, snippet in hits:
+        results.append({
+            "id": item.id,
+            "title": item.title,
+            "summary": item.summary,
+            "url": item.url,
+            "source": item.source,
+            "category": item.category,
+            "impact_score": item.impact_score,
+            "companies": item.companies,
+            "location_name": item.location_name,
+            "latitude": item.latitude,
+            "longitude": item.longitude,
+            "published_at": item.published_at,
+            "rank": rank,
+            "snippet": snippet
+        })
+        
+    return results
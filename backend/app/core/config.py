@@ -10,6 +10,15 @@ class Settings(BaseSettings):
     USE_SQLITE: bool = True
     DATABASE_URL: str = ""
     
+    # Gazetteer data (municipalities, tickers, keywords) - reloaded when files change
+    GAZETTEER_DIR: str = ""
+    GAZETTEER_RELOAD_SECONDS: int = 30
+    
+    # In-memory hot set of recent news served by GET /news (item cap bounds memory)
+    HOT_STORE_HOURS: int = 24
+    HOT_STORE_MAX_ITEMS: int = 5000
+    HOT_STORE_REFRESH_SECONDS: int = 30
+    
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = ["http://localhost:5173", "http://localhost:3000"]
 
@@ -20,6 +29,8 @@ class Settings(BaseSettings):
                 self.DATABASE_URL = f"sqlite:///{db_path}"
             else:
                 self.DATABASE_URL = "postgresql://postgres:postgres@db/openfinance"
+        if not self.GAZETTEER_DIR:
+            self.GAZETTEER_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "gazetteer")
 
     class Config:
         case_sensitive = True
@@ -0,0 +1,25 @@
+"""
+Schema migration step
+Run once before starting the API (the API itself no longer touches the schema):
+
+    python -m app.db.migrate
+"""
+import logging
+from app.db.session import engine, Base
+from app.models import news  # noqa: F401 - registers the models on Base
+from app.services.search import ensure_search_index
+
+logger = logging.getLogger(__name__)
+
+def run_migrations():
+    """Create missing tables and search index structures (idempotent)"""
+    Base.metadata.create_all(bind=engine)
+    ensure_search_index(engine)
+    logger.info("✅ Database schema up to date")
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    run_migrations()
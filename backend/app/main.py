@@ -1,12 +1,13 @@
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from contextlib import asynccontextmanager
+from datetime import datetime
 import logging
 from app.core.config import settings
-from app.db.session import engine, Base
 from app.api import endpoints
-from app.services.ingestion import manager, fetch_real_news
+from app.services.ingestion import manager, fetch_real_news, ingestion_status
+from app.services.hot_store import hot_store
+from app.services.gazetteer import reload_gazetteer
 
 # Configure logging
 logging.basicConfig(
@@ -15,23 +16,53 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Create tables on startup (for MVP simplicity)
-Base.metadata.create_all(bind=engine)
-
-scheduler = AsyncIOScheduler()
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Fetch news immediately on startup
+    # Imported here so module import (and cold start) stays light
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+    
     logger.info("🚀 Starting OpenFinance API...")
-    await fetch_real_news(manager)
     
-    # Then schedule periodic updates (every 2 minutes for RSS)
+    scheduler = AsyncIOScheduler()
+    
+    # Load the gazetteer and pick up edited data files, in a worker thread so
+    # the ~0.5s rebuild never blocks requests
+    scheduler.add_job(
+        reload_gazetteer,
+        'interval',
+        seconds=settings.GAZETTEER_RELOAD_SECONDS,
+        next_run_time=datetime.now(),
+        max_instances=1,
+        coalesce=True,
+        id='gazetteer_reload',
+        name='Gazetteer Reload'
+    )
+    
+    # Keep the hot store in sync with the DB (first run loads it); sync
+    # functions run in a worker thread, off the event loop
+    scheduler.add_job(
+        hot_store.refresh,
+        'interval',
+        seconds=settings.HOT_STORE_REFRESH_SECONDS,
+        next_run_time=datetime.now(),
+        max_instances=1,
+        coalesce=True,
+        id='hot_store_refresh',
+        name='Hot Store Refresh'
+    )
+    
+    # Periodic updates (every 2 minutes for RSS). The first run starts now but
+    # in the background, so cached /news is served right away and /ready
+    # reports when it finishes; max_instances keeps a slow run from overlapping
+    # the next one
     scheduler.add_job(
         fetch_real_news, 
         'interval', 
         minutes=2,  # RSS feeds don't update that often
         args=[manager],
+        next_run_time=datetime.now(),
+        max_instances=1,
+        coalesce=True,
         id='news_fetcher',
         name='RSS News Fetcher'
     )
@@ -75,3 +106,25 @@ async def websocket_endpoint(websocket: WebSocket):
 @app.get("/")
 def root():
     return {"message": "OpenFinance API is running"}
+
+@app.get("/ready")
+def ready(response: Response, wait_for_fetch: bool = False):
+    """
+    Readiness probe. Cached /news is served as soon as the process is up;
+    pass wait_for_fetch=true to get 503 until a fetch cycle has succeeded
+    (status "fetch_failed" with last_fetch_error when the last one failed).
+    """
+    if ingestion_status["initial_fetch_complete"]:
+        status = "ready"
+    elif ingestion_status["last_fetch_error"]:
+        status = "fetch_failed"
+    else:
+        status = "starting"
+    if wait_for_fetch and status != "ready":
+        response.status_code = 503
+    elif not wait_for_fetch:
+        status = "ready"
+    return {
+        "status": status,
+        **ingestion_status
+    }
@@ -24,6 +24,10 @@ class NewsItemResponse(NewsItemBase):
     
     model_config = ConfigDict(from_attributes=True)
 
+class NewsSearchResult(NewsItemResponse):
+    rank: float
+    snippet: Optional[str] = None
+
 class NewsFilter(BaseModel):
     category: Optional[NewsCategory] = None
     impact: Optional[ImpactLevel] = None
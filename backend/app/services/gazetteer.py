@@ -0,0 +1,347 @@
+"""
+Gazetteer for entity extraction
+Loads municipalities, states, B3 tickers and impact keywords from the CSV files
+in GAZETTEER_DIR into precompiled phrase tables, and hot-reloads them when the
+files change on disk (no restart needed)
+"""
+import csv
+import logging
+import math
+import os
+import re
+import sys
+import threading
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+DATA_FILES = (
+    "municipalities.csv", "states.csv", "ambiguous_names.csv",
+    "tickers.csv", "impact_keywords.csv", "sources.csv"
+)
+
+# National capital - last resort when neither text nor source give a location
+DEFAULT_IBGE_CODE = 5300108
+
+TOKEN_RE = re.compile(r"\w+")
+
+# Match kinds, used as ranking weights
+KIND_MUNICIPALITY = 3
+KIND_MUNICIPALITY_ALIAS = 2
+KIND_STATE = 1
+
+@dataclass(frozen=True)
+class Place:
+    name: str
+    uf: str
+    lat: float
+    lon: float
+    population: int = 0
+    capital: bool = False
+
+@dataclass(frozen=True)
+class PhraseMatch:
+    kind: int
+    ref: object   # Place index (locations), ticker (companies) or level (impact)
+    position: int
+    length: int = 1
+
+@lru_cache(maxsize=65536)
+def normalize_token(token: str) -> str:
+    """Lowercase and strip accents ("Goiânia" -> "goiania")"""
+    decomposed = unicodedata.normalize("NFKD", token.lower())
+    return sys.intern("".join(c for c in decomposed if not unicodedata.combining(c)))
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_RE.findall(text)
+
+# Words ending in "s" that are not plurals ("caos" must not become "cao", i.e. "cão")
+INVARIANT_WORDS = frozenset({
+    "caos", "virus", "onibus", "bonus", "status", "campus", "atlas", "lapis", "tenis", "cais", "pires"
+})
+
+@lru_cache(maxsize=65536)
+def stem_token(token: str) -> str:
+    """
+    Light Portuguese stemmer for normalized tokens. Only folds plurals
+    ("crises" -> "crise", "prisoes" -> "prisao", "estaveis" -> "estavel");
+    gender forms are listed as separate keywords.
+    """
+    if token in INVARIANT_WORDS:
+        return token
+    for suffix, replacement in (("oes", "ao"), ("aes", "ao"), ("ais", "al"), ("eis", "el")):
+        if token.endswith(suffix) and len(token) > 4:
+            return token[:-3] + replacement
+    if token.endswith("s") and len(token) > 3:
+        return token[:-1]
+    return token
+
+def phrase_key(text: str, stem: bool = False) -> Tuple[str, ...]:
+    tokens = (normalize_token(t) for t in tokenize(text))
+    return tuple(stem_token(t) if stem else t for t in tokens)
+
+class PhraseTable:
+    """
+    Maps normalized token tuples to payloads. Lookup scans the text once,
+    trying at most `max_len` hash probes per token, so the cost depends on
+    the text length only - not on how many phrases are loaded.
+    """
+
+    def __init__(self, stem: bool = False):
+        self.phrases: Dict[Tuple[str, ...], list] = {}
+        self.max_len = 0
+        self.stem = stem
+
+    def add(self, phrase: str, kind: int, ref, proper: bool = False):
+        """
+        proper: only match when capitalized in the text ("Natal", not "natal").
+        Single accented words must keep their accent ("Pará" must not match "para"),
+        except in stemmed tables, where inflected forms have to match too.
+        """
+        key = phrase_key(phrase, self.stem)
+        if not key:
+            return
+        exact = None
+        if not self.stem and len(key) == 1 and key[0] != phrase.strip().lower():
+            exact = phrase.strip().lower()
+        self.phrases.setdefault(key, []).append((kind, ref, exact, proper))
+        self.max_len = max(self.max_len, len(key))
+
+    def freeze(self):
+        self.phrases = {key: tuple(payloads) for key, payloads in self.phrases.items()}
+
+    def scan(self, text: str):
+        """Yield PhraseMatch for every phrase found, preferring the longest match at each position"""
+        tokens = tokenize(text)
+        normalized = [normalize_token(t) for t in tokens]
+        if self.stem:
+            normalized = [stem_token(t) for t in normalized]
+        i = 0
+        count = len(normalized)
+        while i < count:
+            for n in range(min(self.max_len, count - i), 0, -1):
+                payloads = self.phrases.get(tuple(normalized[i:i + n]))
+                if not payloads:
+                    continue
+                first = tokens[i]
+                accepted = [
+                    PhraseMatch(kind=kind, ref=ref, position=i, length=n)
+                    for kind, ref, exact, proper in payloads
+                    if (exact is None or first.lower() == exact) and (not proper or first[:1].isupper())
+                ]
+                if accepted:
+                    yield from accepted
+                    i += n
+                    break
+            else:
+                i += 1
+
+class Gazetteer:
+    def __init__(self, data_dir: str):
+        self.data_dir = data_dir
+        self.places: List[Place] = []
+        self.by_ibge: Dict[int, int] = {}
+        self.states: Dict[str, Place] = {}
+        self.source_places: Dict[str, int] = {}
+        # Municipalities named like common words ("União", "Feliz"), only matched with their state
+        self.ambiguous: set = set()
+        self.locations = PhraseTable()
+        self.companies = PhraseTable()
+        # Stemmed, so "crises"/"recordes"/"prisões" hit "crise"/"recorde"/"prisão"
+        self.impact = PhraseTable(stem=True)
+        self._load()
+
+    def _rows(self, filename: str):
+        with open(os.path.join(self.data_dir, filename), encoding="utf-8", newline="") as f:
+            yield from csv.DictReader(f)
+
+    @staticmethod
+    def _aliases(row: dict) -> List[str]:
+        return [a for a in (row.get("aliases") or "").split("|") if a.strip()]
+
+    def _load(self):
+        for row in self._rows("states.csv"):
+            uf = row["uf"].strip().upper()
+            self.states[uf] = Place(
+                name=row["name"], uf=uf,
+                lat=float(row["latitude"]), lon=float(row["longitude"])
+            )
+            self.locations.add(row["name"], KIND_STATE, uf, proper=True)
+            for alias in self._aliases(row):
+                self.locations.add(alias, KIND_STATE, uf)
+
+        ambiguous_names = {phrase_key(row["name"]) for row in self._rows("ambiguous_names.csv")}
+
+        for row in self._rows("municipalities.csv"):
+            index = len(self.places)
+            self.places.append(Place(
+                name=sys.intern(row["name"]), uf=sys.intern(row["uf"].strip().upper()),
+                lat=float(row["latitude"]), lon=float(row["longitude"]),
+                population=int(row.get("population") or 0),
+                capital=row.get("capital") == "1"
+            ))
+            self.by_ibge[int(row["ibge_code"])] = index
+            if phrase_key(row["name"]) in ambiguous_names:
+                self.ambiguous.add(index)
+            self.locations.add(row["name"], KIND_MUNICIPALITY, index, proper=True)
+            for alias in self._aliases(row):
+                self.locations.add(alias, KIND_MUNICIPALITY_ALIAS, index)
+
+        for row in self._rows("tickers.csv"):
+            ticker = sys.intern(row["ticker"].strip().upper())
+            self.companies.add(ticker, 0, ticker)
+            self.companies.add(row["company"], 0, ticker, proper=True)
+            for alias in self._aliases(row):
+                self.companies.add(alias, 0, ticker)
+
+        for row in self._rows("impact_keywords.csv"):
+            self.impact.add(row["keyword"], 0, row["level"].strip())
+
+        for row in self._rows("sources.csv"):
+            code = int(row["ibge_code"])
+            if code in self.by_ibge:
+                self.source_places[row["source"]] = self.by_ibge[code]
+
+        for table in (self.locations, self.companies, self.impact):
+            table.freeze()
+
+        logger.info(
+            f"🗺️ Gazetteer loaded: {len(self.places)} municipalities, "
+            f"{len(self.states)} states, {len(self.companies.phrases)} company phrases"
+        )
+
+    def find_location(self, text: str) -> Optional[Place]:
+        """
+        Best location mentioned in the text. Ambiguous names are ranked by:
+        state also mentioned in the text, official name over alias, capital,
+        population, then earliest mention. With no municipality, the state
+        centroid is used.
+        """
+        candidates: List[PhraseMatch] = []
+        mentioned_states = set()
+
+        for match in self.locations.scan(text):
+            if match.kind == KIND_STATE:
+                mentioned_states.add(match.ref)
+            candidates.append(match)
+
+        # State codes only count in uppercase ("(SP)", "- RJ"), since "se", "pa", "to"... are words
+        for token in tokenize(text):
+            if len(token) == 2 and token.isupper() and token in self.states:
+                mentioned_states.add(token)
+
+        # Tokens that name a company ("Itaú Unibanco", "Suzano") are not a place,
+        # unless the municipality's state is mentioned too
+        company_positions = {
+            position
+            for m in self.companies.scan(text)
+            for position in range(m.position, m.position + m.length)
+        }
+
+        state_positions = {m.position for m in candidates if m.kind == KIND_STATE}
+        municipalities = [
+            m for m in candidates
+            if m.kind != KIND_STATE
+            # "Paraná" is the state, not the small town in RN (capitals like São Paulo still win)
+            and not (m.position in state_positions and not self.places[m.ref].capital)
+            and (
+                (m.ref not in self.ambiguous and m.position not in company_positions)
+                or self.places[m.ref].uf in mentioned_states
+            )
+        ]
+        if municipalities:
+            def score(match: PhraseMatch):
+                place = self.places[match.ref]
+                return (
+                    place.uf in mentioned_states,
+                    match.kind,
+                    place.capital,
+                    math.log1p(place.population),
+                    -match.position,
+                )
+            best = max(municipalities, key=score)
+            place = self.places[best.ref]
+            # A loose alias ("rio") loses to an explicitly mentioned other state
+            if best.kind == KIND_MUNICIPALITY or not mentioned_states or place.uf in mentioned_states:
+                return place
+
+        if mentioned_states:
+            first = min(
+                (m for m in candidates if m.kind == KIND_STATE),
+                key=lambda m: m.position,
+                default=None
+            )
+            return self.states[first.ref if first else sorted(mentioned_states)[0]]
+
+        return None
+
+    def fallback_location(self, source: Optional[str] = None) -> Place:
+        """Deterministic location when the text mentions none: the source's home, else Brasília"""
+        index = self.source_places.get(source) if source else None
+        if index is None:
+            index = self.by_ibge.get(DEFAULT_IBGE_CODE, 0)
+        return self.places[index]
+
+    def find_companies(self, text: str) -> List[str]:
+        """Tickers mentioned in the text, in order of first mention"""
+        found = []
+        for match in self.companies.scan(text):
+            if match.ref not in found:
+                found.append(match.ref)
+        return found
+
+    def impact_levels(self, text: str) -> set:
+        return {match.ref for match in self.impact.scan(text)}
+
+
+_gazetteer: Optional[Gazetteer] = None
+_signature: Optional[tuple] = None
+_lock = threading.Lock()
+
+def _files_signature(data_dir: str) -> tuple:
+    signature = []
+    for filename in DATA_FILES:
+        stat = os.stat(os.path.join(data_dir, filename))
+        signature.append((filename, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+def get_gazetteer() -> Gazetteer:
+    """
+    Current gazetteer - a plain read once loaded. Only the very first call
+    builds it; callers on the event loop should warm it in a thread first
+    (see reload_gazetteer, run by the scheduler).
+    """
+    if _gazetteer is not None:
+        return _gazetteer
+    reload_gazetteer()
+    return _gazetteer
+
+def reload_gazetteer():
+    """
+    Rebuild the gazetteer if its data files changed on disk. Blocking
+    (~0.5s for the full data), so it runs in a worker thread every
+    GAZETTEER_RELOAD_SECONDS; the new tables are swapped in atomically and
+    a failed rebuild keeps the previous data in use.
+    """
+    global _gazetteer, _signature
+
+    with _lock:
+        data_dir = settings.GAZETTEER_DIR
+        try:
+            signature = _files_signature(data_dir)
+            if _gazetteer is None or signature != _signature:
+                # Remember the signature even if the build fails, so a broken
+                # file is retried only after it changes again
+                _signature = signature
+                gazetteer = Gazetteer(data_dir)
+                if _gazetteer is not None:
+                    logger.info("🔄 Gazetteer reloaded")
+                _gazetteer = gazetteer
+        except Exception as e:
+            if _gazetteer is None:
+                raise
+            logger.error(f"Error reloading gazetteer, keeping previous data: {e}")
@@ -0,0 +1,191 @@
+"""
+In-process hot set of recent news
+Keeps the last HOT_STORE_HOURS of items (capped at HOT_STORE_MAX_ITEMS) as
+compact __slots__ records, indexed by category, impact and ticker, so the
+common GET /news queries are answered without a DB round trip. The store is
+re-synced from the DB every HOT_STORE_REFRESH_SECONDS, so items inserted by
+other API processes show up too
+"""
+import bisect
+import logging
+import sys
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set
+from sqlalchemy import exists, func
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.news import NewsItem
+
+logger = logging.getLogger(__name__)
+
+REFRESH_ID_OVERLAP = 100
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else value
+
+class NewsRecord:
+    """Read-only copy of a NewsItem; low-cardinality strings are interned"""
+
+    __slots__ = (
+        "id", "title", "summary", "url", "source", "category", "impact_score",
+        "tickers", "location_name", "latitude", "longitude", "published_at"
+    )
+
+    def __init__(self, item: NewsItem):
+        self.id = item.id
+        self.title = item.title
+        self.summary = item.summary
+        self.url = item.url
+        self.source = _intern(item.source)
+        self.category = _intern(item.category)
+        self.impact_score = _intern(item.impact_score)
+        self.tickers = tuple(sys.intern(t) for t in item.companies.split(",") if t) if item.companies else ()
+        self.location_name = _intern(item.location_name)
+        self.latitude = item.latitude
+        self.longitude = item.longitude
+        self.published_at = item.published_at or datetime.now()
+
+    def as_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "summary": self.summary,
+            "url": self.url,
+            "source": self.source,
+            "category": self.category,
+            "impact_score": self.impact_score,
+            "companies": ",".join(self.tickers) if self.tickers else None,
+            "location_name": self.location_name,
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "published_at": self.published_at
+        }
+
+class HotNewsStore:
+    def __init__(self, hours: int, max_items: int):
+        self.window = timedelta(hours=hours)
+        self.max_items = max_items
+        self.records: Dict[int, NewsRecord] = {}
+        # (published_at, id) ascending - newest at the end
+        self.order: List[tuple] = []
+        self.by_category: Dict[str, Set[int]] = {}
+        self.by_impact: Dict[str, Set[int]] = {}
+        self.by_ticker: Dict[str, Set[int]] = {}
+        # True once loaded from the DB; complete means the DB had nothing we
+        # don't hold at the last refresh
+        self.ready = False
+        self.complete = False
+        self.max_seen_id = 0
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """
+        Sync with the DB, which is shared by every API process: the first call
+        loads the whole window, later calls pick up rows inserted since (by
+        this process or any other). Run periodically by the scheduler.
+        """
+        cutoff = datetime.now() - self.window
+        db = SessionLocal()
+        try:
+            query = db.query(NewsItem).filter(NewsItem.published_at >= cutoff)
+            if self.ready:
+                # Re-read a few ids back to catch rows committed out of id order
+                query = query.filter(NewsItem.id > self.max_seen_id - REFRESH_ID_OVERLAP)
+            items = query.order_by(NewsItem.published_at.desc()).limit(self.max_items).all()
+            older_exists = db.query(exists().where(NewsItem.published_at < cutoff)).scalar()
+            window_count = db.query(func.count(NewsItem.id)).filter(NewsItem.published_at >= cutoff).scalar()
+        except Exception as e:
+            logger.error(f"Error refreshing hot store: {e}")
+            return
+        finally:
+            db.close()
+
+        with self._lock:
+            loaded = 0
+            for item in items:
+                self.max_seen_id = max(self.max_seen_id, item.id)
+                if item.id not in self.records:
+                    self._insert(NewsRecord(item))
+                    loaded += 1
+            self._evict()
+            # Re-checked on every refresh: complete only while we hold every row the DB has
+            self.complete = not older_exists and window_count == len(self.records)
+            self.ready = True
+        if loaded:
+            logger.info(f"🔥 Hot store loaded {loaded} items ({len(self.records)} total)")
+
+    def add(self, item: NewsItem):
+        """Add a freshly ingested item (visible right away, before the next refresh)"""
+        record = NewsRecord(item)
+        with self._lock:
+            if record.id in self.records:
+                return
+            self._insert(record)
+            self._evict()
+
+    def query(
+        self,
+        limit: int = 100,
+        category: Optional[str] = None,
+        impact: Optional[str] = None,
+        ticker: Optional[str] = None
+    ) -> Optional[List[NewsRecord]]:
+        """
+        Newest-first matches, or None when the store cannot answer on its own
+        (not warmed up yet, or fewer than `limit` hits and older items may be in the DB)
+        """
+        with self._lock:
+            if not self.ready:
+                return None
+            self._evict()
+
+            filters = []
+            if category:
+                filters.append(self.by_category.get(category, set()))
+            if impact:
+                filters.append(self.by_impact.get(impact, set()))
+            if ticker:
+                filters.append(self.by_ticker.get(ticker.upper(), set()))
+
+            if filters:
+                filters.sort(key=len)
+                ids = set(filters[0]).intersection(*filters[1:])
+                keys = sorted(
+                    ((self.records[i].published_at, i) for i in ids),
+                    reverse=True
+                )[:limit]
+            else:
+                keys = self.order[:-limit - 1:-1] if limit > 0 else []
+
+            if len(keys) < limit and not self.complete:
+                return None
+            return [self.records[i] for _, i in keys]
+
+    def _insert(self, record: NewsRecord):
+        self.records[record.id] = record
+        bisect.insort(self.order, (record.published_at, record.id))
+        self.by_category.setdefault(record.category, set()).add(record.id)
+        self.by_impact.setdefault(record.impact_score, set()).add(record.id)
+        for ticker in record.tickers:
+            self.by_ticker.setdefault(ticker, set()).add(record.id)
+
+    def _evict(self):
+        """Drop items outside the time window or over the item cap (oldest first)"""
+        cutoff = datetime.now() - self.window
+        count = bisect.bisect_left(self.order, (cutoff,))
+        count = max(count, len(self.order) - self.max_items)
+        if count <= 0:
+            return
+
+        for _, record_id in self.order[:count]:
+            record = self.records.pop(record_id)
+            self.by_category[record.category].discard(record_id)
+            self.by_impact[record.impact_score].discard(record_id)
+            for ticker in record.tickers:
+                self.by_ticker[ticker].discard(record_id)
+        del self.order[:count]
+        # Evicted items are still in the DB
+        self.complete = False
+
+hot_store = HotNewsStore(settings.HOT_STORE_HOURS, settings.HOT_STORE_MAX_ITEMS)
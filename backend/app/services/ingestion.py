@@ -5,16 +5,27 @@ import hashlib
 from datetime import datetime
 from sqlalchemy.orm import Session
 from sqlalchemy import exists
+from sqlalchemy.exc import OperationalError
 from app.db.session import SessionLocal
 from app.models.news import NewsItem, NewsCategory, ImpactLevel
+from app.services.gazetteer import get_gazetteer
 from app.services.nlp import extract_entities, calculate_impact, classify_category
-from app.services.rss_scraper import fetch_all_feeds, RawNewsItem
+from app.services.search import index_news_item
+from app.services.hot_store import hot_store
 
 logger = logging.getLogger(__name__)
 
 # Set of already processed URLs (in-memory cache)
 processed_urls = set()
 
+# Exposed by the /ready endpoint
+ingestion_status = {
+    "initial_fetch_complete": False,
+    "last_fetch_at": None,
+    "last_fetch_new_items": 0,
+    "last_fetch_error": None
+}
+
 def url_hash(url: str) -> str:
     """Generate hash for URL deduplication"""
     return hashlib.md5(url.encode()).hexdigest()[:16]
@@ -24,12 +35,21 @@ async def fetch_real_news(ws_manager):
     Fetches real news from RSS feeds, processes them, saves to DB,
     and broadcasts via WebSocket.
     """
+    # Imported lazily: feedparser/BeautifulSoup/aiohttp are only needed here
+    from app.services.rss_scraper import fetch_all_feeds
+    
     db: Session = SessionLocal()
     new_items_count = 0
+    error = None
     
     try:
+        # Build/load the gazetteer in a worker thread, not on the event loop
+        await asyncio.to_thread(get_gazetteer)
+        
         # Fetch from all RSS feeds
         raw_items = await fetch_all_feeds()
+        if not raw_items:
+            raise RuntimeError("no items fetched from any RSS feed")
         logger.info(f"📥 Processing {len(raw_items)} raw news items...")
         
         for raw_item in raw_items:
@@ -47,7 +67,7 @@ async def fetch_real_news(ws_manager):
                 
                 # Process with NLP
                 full_text = f"{raw_item.title} {raw_item.summary}"
-                entities = extract_entities(full_text)
+                entities = extract_entities(full_text, raw_item.source)
                 impact = calculate_impact(full_text)
                 category = classify_category(full_text, raw_item.category)
                 
@@ -67,8 +87,13 @@ async def fetch_real_news(ws_manager):
                 )
                 
                 db.add(news_item)
+                db.flush()
+                
+                # Keep full-text index in sync (same transaction)
+                index_news_item(db, news_item)
                 db.commit()
                 db.refresh(news_item)
+                hot_store.add(news_item)
                 
                 processed_urls.add(url_id)
                 new_items_count += 1
@@ -94,6 +119,9 @@ async def fetch_real_news(ws_manager):
                 # Small delay to not flood WebSocket
                 await asyncio.sleep(0.5)
                 
+            except OperationalError:
+                # DB unreachable - fail the whole cycle instead of every item
+                raise
             except Exception as e:
                 logger.error(f"Error processing item: {e}")
                 db.rollback()
@@ -103,8 +131,15 @@ async def fetch_real_news(ws_manager):
         
     except Exception as e:
         logger.error(f"Error in fetch_real_news: {e}")
+        error = str(e)
     finally:
         db.close()
+        # Only a cycle that ran to the end counts for /ready
+        if error is None:
+            ingestion_status["initial_fetch_complete"] = True
+        ingestion_status["last_fetch_at"] = datetime.now().isoformat()
+        ingestion_status["last_fetch_new_items"] = new_items_count
+        ingestion_status["last_fetch_error"] = error
 
 
 # Keep mock generator for fallback/testing
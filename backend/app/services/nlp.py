@@ -1,6 +1,5 @@
-import random
-import re
 from typing import Dict, List, Optional
+from app.services.gazetteer import get_gazetteer
 
 # Expanded NLP module for real news processing
 
@@ -9,124 +8,41 @@ BRAZIL_BOUNDS = {
     "min_lon": -73.99, "max_lon": -34.79
 }
 
-# Expanded cities database with coordinates
-CITIES = [
-    {"name": "São Paulo", "lat": -23.5505, "lon": -46.6333, "aliases": ["sp", "sampa", "paulista"]},
-    {"name": "Rio de Janeiro", "lat": -22.9068, "lon": -43.1729, "aliases": ["rj", "carioca", "rio"]},
-    {"name": "Brasília", "lat": -15.7801, "lon": -47.9292, "aliases": ["df", "planalto", "congresso"]},
-    {"name": "Belo Horizonte", "lat": -19.9167, "lon": -43.9345, "aliases": ["bh", "mineiro"]},
-    {"name": "Salvador", "lat": -12.9777, "lon": -38.5016, "aliases": ["bahia", "ba"]},
-    {"name": "Manaus", "lat": -3.1190, "lon": -60.0217, "aliases": ["amazonas", "am"]},
-    {"name": "Porto Alegre", "lat": -30.0346, "lon": -51.2177, "aliases": ["rs", "gaúcho"]},
-    {"name": "Curitiba", "lat": -25.4290, "lon": -49.2671, "aliases": ["pr", "paranaense"]},
-    {"name": "Recife", "lat": -8.0476, "lon": -34.8770, "aliases": ["pe", "pernambuco"]},
-    {"name": "Fortaleza", "lat": -3.7172, "lon": -38.5433, "aliases": ["ce", "ceará"]},
-    {"name": "Belém", "lat": -1.4558, "lon": -48.4902, "aliases": ["pa", "pará"]},
-    {"name": "Goiânia", "lat": -16.6869, "lon": -49.2648, "aliases": ["go", "goiás"]},
-    {"name": "Campinas", "lat": -22.9099, "lon": -47.0626, "aliases": ["campineiro"]},
-    {"name": "Santos", "lat": -23.9608, "lon": -46.3336, "aliases": ["porto de santos"]},
-    {"name": "Vitória", "lat": -20.2976, "lon": -40.2958, "aliases": ["es", "espírito santo"]},
-    {"name": "Florianópolis", "lat": -27.5954, "lon": -48.5480, "aliases": ["sc", "floripa"]},
-    {"name": "Cuiabá", "lat": -15.6014, "lon": -56.0979, "aliases": ["mt", "mato grosso"]},
-    {"name": "Campo Grande", "lat": -20.4697, "lon": -54.6201, "aliases": ["ms", "mato grosso do sul"]},
-]
-
-# Brazilian company tickers
-COMPANIES = {
-    "PETR4": ["petrobras", "petroleo", "petróleo", "petr4", "petr3"],
-    "VALE3": ["vale", "minério", "mineração", "vale3"],
-    "ITUB4": ["itaú", "itau", "itub4", "itub3"],
-    "BBDC4": ["bradesco", "bbdc4", "bbdc3"],
-    "BBAS3": ["banco do brasil", "bb", "bbas3"],
-    "WEGE3": ["weg", "wege3", "motores"],
-    "MGLU3": ["magazine luiza", "magalu", "mglu3"],
-    "ABEV3": ["ambev", "cerveja", "abev3"],
-    "JBSS3": ["jbs", "frigorífico", "jbss3"],
-    "SUZB3": ["suzano", "papel", "celulose", "suzb3"],
-    "B3SA3": ["b3", "bolsa", "bovespa", "b3sa3"],
-    "RENT3": ["localiza", "aluguel", "rent3"],
-    "LREN3": ["renner", "lojas renner", "lren3"],
-    "RAIL3": ["rumo", "ferrovia", "rail3"],
-    "EMBR3": ["embraer", "aviação", "embr3"],
-}
-
-# Impact keywords
-IMPACT_KEYWORDS = {
-    "high": [
-        "crise", "colapso", "recorde", "urgente", "guerra", "queda forte",
-        "alta forte", "disparada", "derrocada", "desastre", "escândalo",
-        "impeachment", "prisão", "fraude", "bilhões", "trilhões", "histórico",
-        "emergência", "caos", "greve geral", "lockdown", "pandemia"
-    ],
-    "medium": [
-        "aumento", "queda", "mudança", "reforma", "votação", "projeto",
-        "investimento", "acordo", "negociação", "meta", "expectativa",
-        "previsão", "análise", "tendência", "mercado", "inflação"
-    ],
-    "low": [
-        "estável", "manutenção", "previsão", "leve", "moderado",
-        "rotina", "agenda", "reunião", "estudo", "pesquisa"
-    ]
-}
-
 def extract_location(text: str) -> Optional[Dict]:
-    """Extract location from text using keyword matching"""
-    text_lower = text.lower()
-    
-    for city in CITIES:
-        # Check city name
-        if city["name"].lower() in text_lower:
-            return city
-        
-        # Check aliases
-        for alias in city.get("aliases", []):
-            if alias in text_lower:
-                return city
-    
-    # Default to Brasília for political news, São Paulo for financial
-    return None
+    """Extract location from text using the gazetteer"""
+    place = get_gazetteer().find_location(text)
+    if not place:
+        return None
+    return {"name": place.name, "lat": place.lat, "lon": place.lon}
 
 def extract_companies(text: str) -> List[str]:
     """Extract company tickers from text"""
-    text_lower = text.lower()
-    found = []
-    
-    for ticker, keywords in COMPANIES.items():
-        for keyword in keywords:
-            if keyword in text_lower:
-                if ticker not in found:
-                    found.append(ticker)
-                break
-    
-    return found
+    return get_gazetteer().find_companies(text)
 
 def calculate_impact(text: str) -> str:
     """Calculate impact score based on keywords"""
-    text_lower = text.lower()
-    
-    # Check high impact first
-    for keyword in IMPACT_KEYWORDS["high"]:
-        if keyword in text_lower:
-            return "high"
+    levels = get_gazetteer().impact_levels(text)
     
-    # Check low impact
-    for keyword in IMPACT_KEYWORDS["low"]:
-        if keyword in text_lower:
-            return "low"
+    # High impact wins, then low
+    if "high" in levels:
+        return "high"
+    if "low" in levels:
+        return "low"
     
     # Default to medium
     return "medium"
 
-def extract_entities(text: str) -> dict:
+def extract_entities(text: str, source: Optional[str] = None) -> dict:
     """
     Extract all entities from text (location, companies, etc.)
     """
     location = extract_location(text)
     companies = extract_companies(text)
     
-    # If no location found, pick based on context or random
+    # If no location found, fall back to the source's home city (deterministic)
     if not location:
-        location = random.choice(CITIES)
+        place = get_gazetteer().fallback_location(source)
+        location = {"name": place.name, "lat": place.lat, "lon": place.lon}
     
     return {
         "companies": ",".join(companies) if companies else None,
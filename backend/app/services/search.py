@@ -0,0 +1,179 @@
+"""
+Full-text search over news titles and summaries
+Postgres uses a tsvector column + GIN index (Portuguese, accent-insensitive),
+SQLite falls back to an FTS5 virtual table
+"""
+import html
+import logging
+import re
+from typing import List, Optional, Tuple
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from app.models.news import NewsItem
+
+logger = logging.getLogger(__name__)
+
+# Portuguese config with unaccent, so "tributaria" matches "tributária"
+PG_TS_CONFIG = "portuguese_unaccent"
+SQLITE_FTS_TABLE = "news_fts"
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+
+# Private-use sentinels the DB wraps around matches; the snippet is HTML-escaped
+# afterwards and only these are turned into <mark> tags, so feed text can't inject markup
+SENTINEL_START = "\ue000"
+SENTINEL_STOP = "\ue001"
+
+# Title matches weigh more than summary matches
+PG_VECTOR_EXPR = (
+    f"setweight(to_tsvector('{PG_TS_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{PG_TS_CONFIG}', coalesce(summary, '')), 'B')"
+)
+
+PG_SETUP = [
+    # Serialize concurrent migration runs (held until the transaction ends)
+    "SELECT pg_advisory_xact_lock(hashtext('openfinance_search_index'))",
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    f"""
+    DO $$
+    BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = '{PG_TS_CONFIG}') THEN
+            CREATE TEXT SEARCH CONFIGURATION {PG_TS_CONFIG} (COPY = portuguese);
+            ALTER TEXT SEARCH CONFIGURATION {PG_TS_CONFIG}
+                ALTER MAPPING FOR hword, hword_part, word WITH unaccent, portuguese_stem;
+        END IF;
+    END
+    $$
+    """,
+    # Only ALTER (ACCESS EXCLUSIVE lock) when the column is really missing
+    """
+    DO $$
+    BEGIN
+        IF NOT EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = 'news_items' AND column_name = 'search_vector'
+        ) THEN
+            ALTER TABLE news_items ADD COLUMN search_vector tsvector;
+        END IF;
+    END
+    $$
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_news_items_search_vector ON news_items USING GIN (search_vector)",
+    # Backfill rows inserted before the index existed (runs in the one-shot migration job only)
+    f"UPDATE news_items SET search_vector = {PG_VECTOR_EXPR} WHERE search_vector IS NULL",
+]
+
+SQLITE_SETUP = [
+    # remove_diacritics gives accent-insensitive matching
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE}
+    USING fts5(title, summary, tokenize = 'unicode61 remove_diacritics 2')
+    """,
+    f"""
+    INSERT INTO {SQLITE_FTS_TABLE} (rowid, title, summary)
+    SELECT id, coalesce(title, ''), coalesce(summary, '') FROM news_items
+    WHERE id NOT IN (SELECT rowid FROM {SQLITE_FTS_TABLE})
+    """,
+]
+
+def is_postgres(bind) -> bool:
+    return bind.dialect.name == "postgresql"
+
+def ensure_search_index(engine: Engine):
+    """Create the search index structures (idempotent) and backfill missing rows"""
+    statements = PG_SETUP if is_postgres(engine) else SQLITE_SETUP
+    with engine.begin() as conn:
+        for statement in statements:
+            conn.execute(text(statement))
+    logger.info(f"🔎 Search index ready ({engine.dialect.name})")
+
+def index_news_item(db: Session, item: NewsItem):
+    """Add/refresh a news item in the search index (item must be flushed)"""
+    if is_postgres(db.get_bind()):
+        db.execute(
+            text(f"UPDATE news_items SET search_vector = {PG_VECTOR_EXPR} WHERE id = :id"),
+            {"id": item.id}
+        )
+    else:
+        db.execute(text(f"DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid = :id"), {"id": item.id})
+        db.execute(
+            text(f"INSERT INTO {SQLITE_FTS_TABLE} (rowid, title, summary) VALUES (:id, :title, :summary)"),
+            {"id": item.id, "title": item.title or "", "summary": item.summary or ""}
+        )
+
+def build_fts5_query(query: str) -> str:
+    """
+    Turn free user input into a safe FTS5 query (all terms required). Terms are
+    prefix queries, roughly matching Postgres stemming ("reforma" -> "reformas").
+    """
+    terms = re.findall(r"\w+", query)
+    return " ".join(f'"{term}"*' for term in terms)
+
+def render_snippet(snippet: Optional[str]) -> Optional[str]:
+    """Escape the raw snippet, then turn the match sentinels into <mark> tags"""
+    if snippet is None:
+        return None
+    escaped = html.escape(snippet)
+    return escaped.replace(SENTINEL_START, HIGHLIGHT_START).replace(SENTINEL_STOP, HIGHLIGHT_STOP)
+
+def search_news(
+    db: Session,
+    query: str,
+    limit: int = 20,
+    category: Optional[str] = None,
+    impact: Optional[str] = None
+) -> List[Tuple[NewsItem, float, str]]:
+    """
+    Ranked full-text search. Returns (item, rank, snippet) tuples,
+    best match first; snippets are HTML-escaped, with matched terms in <mark> tags.
+    """
+    params = {"q": query, "limit": limit}
+    filters = ""
+    if category:
+        filters += " AND n.category = :category"
+        params["category"] = category
+    if impact:
+        filters += " AND n.impact_score = :impact"
+        params["impact"] = impact
+
+    if is_postgres(db.get_bind()):
+        sql = f"""
+            SELECT n.id,
+                   ts_rank_cd(n.search_vector, q) AS rank,
+                   ts_headline('{PG_TS_CONFIG}',
+                               coalesce(n.title, '') || ' — ' || coalesce(n.summary, ''), q,
+                               'StartSel="{SENTINEL_START}", StopSel="{SENTINEL_STOP}", MaxFragments=2, MaxWords=20, MinWords=8') AS snippet
+            FROM news_items n, websearch_to_tsquery('{PG_TS_CONFIG}', :q) q
+            WHERE n.search_vector @@ q{filters}
+            ORDER BY rank DESC, n.published_at DESC
+            LIMIT :limit
+        """
+    else:
+        params["q"] = build_fts5_query(query)
+        if not params["q"]:
+            return []
+        sql = f"""
+            SELECT n.id,
+                   -bm25({SQLITE_FTS_TABLE}, 4.0, 1.0) AS rank,
+                   snippet({SQLITE_FTS_TABLE}, -1, '{SENTINEL_START}', '{SENTINEL_STOP}', '…', 20) AS snippet
+            FROM {SQLITE_FTS_TABLE}
+            JOIN news_items n ON n.id = {SQLITE_FTS_TABLE}.rowid
+            WHERE {SQLITE_FTS_TABLE} MATCH :q{filters}
+            ORDER BY bm25({SQLITE_FTS_TABLE}, 4.0, 1.0), n.published_at DESC
+            LIMIT :limit
+        """
+
+    hits = db.execute(text(sql), params).all()
+    if not hits:
+        return []
+
+    items = db.query(NewsItem).filter(NewsItem.id.in_([hit.id for hit in hits])).all()
+    items_by_id = {item.id: item for item in items}
+
+    return [
+        (items_by_id[hit.id], float(hit.rank), render_snippet(hit.snippet))
+        for hit in hits
+        if hit.id in items_by_id
+    ]
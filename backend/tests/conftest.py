@@ -0,0 +1,13 @@
+import os
+import tempfile
+
+# Point the app at a throwaway SQLite DB before app.core.config is imported
+_db_dir = tempfile.mkdtemp(prefix="openfinance-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+
+import pytest
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    from app.db.migrate import run_migrations
+    run_migrations()
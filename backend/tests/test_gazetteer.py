@@ -0,0 +1,70 @@
+import pytest
+from app.services.gazetteer import get_gazetteer, stem_token
+from app.services.nlp import calculate_impact, extract_entities
+
+@pytest.fixture(scope="module")
+def gazetteer():
+    return get_gazetteer()
+
+@pytest.mark.parametrize("text, expected", [
+    ("Prefeitura de Goiânia anuncia obras", ("Goiânia", "GO")),
+    ("Chuvas atingem Campinas", ("Campinas", "SP")),
+    ("Governo do Paraná lança programa", ("Paraná", "PR")),
+    ("Enchente em União (PI) desaloja famílias", ("União", "PI")),
+    ("Feira em Natal movimenta turismo", ("Natal", "RN")),
+])
+def test_find_location(gazetteer, text, expected):
+    place = gazetteer.find_location(text)
+    assert (place.name, place.uf) == expected
+
+@pytest.mark.parametrize("text", [
+    "União Europeia aprova acordo",
+    "Dólar sobe para R$ 5,10",
+    "Empresa feliz com resultado do trimestre",
+])
+def test_find_location_ignores_common_words(gazetteer, text):
+    assert gazetteer.find_location(text) is None
+
+@pytest.mark.parametrize("text", [
+    "Itaú Unibanco lucra bilhões",
+    "Itaú e Bradesco sobem; BBAS3 cai",
+    "Suzano anuncia investimento",
+    "Assaí abre novas lojas",
+])
+def test_company_name_is_not_a_location(gazetteer, text):
+    assert gazetteer.find_location(text) is None
+
+def test_company_named_place_matches_with_its_state(gazetteer):
+    place = gazetteer.find_location("Prefeitura de Suzano (SP) anuncia obra")
+    assert (place.name, place.uf) == ("Suzano", "SP")
+
+def test_company_mention_falls_back_to_source_city():
+    entities = extract_entities("Itaú Unibanco lucra bilhões", "InfoMoney")
+    assert entities["companies"] == "ITUB4"
+    assert entities["location_name"] == "São Paulo"
+
+def test_find_companies(gazetteer):
+    assert gazetteer.find_companies("Petrobras e VALE3 puxam o Ibovespa") == ["PETR4", "VALE3"]
+
+@pytest.mark.parametrize("token, expected", [
+    ("crises", "crise"),
+    ("recordes", "recorde"),
+    ("prisoes", "prisao"),
+    ("estaveis", "estavel"),
+    ("caos", "caos"),
+    ("reunia", "reunia"),
+    ("historica", "historica"),
+])
+def test_stem_token(token, expected):
+    assert stem_token(token) == expected
+
+@pytest.mark.parametrize("text, expected", [
+    ("Novas crises e recordes no mercado", "high"),
+    ("Operação resulta em prisões", "high"),
+    ("Caos no trânsito da capital", "high"),
+    ("Cão foge de casa", "medium"),
+    ("O evento reunia artistas locais", "medium"),
+    ("Reunião do conselho termina sem novidades", "low"),
+])
+def test_calculate_impact(text, expected):
+    assert calculate_impact(text) == expected
@@ -0,0 +1,159 @@
+import itertools
+import random
+from datetime import datetime, timedelta
+import pytest
+from app.api.endpoints import query_recent_news
+from app.db.session import SessionLocal
+from app.models.news import NewsItem
+from app.services.hot_store import HotNewsStore
+
+CATEGORIES = ["financial", "political", "geopolitical"]
+IMPACTS = ["high", "medium", "low"]
+TICKERS = ["PETR4", "VALE3", "B3SA3", "ITUB4"]
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    session.query(NewsItem).delete()
+    session.commit()
+    yield session
+    session.close()
+
+def add_news(db, age: timedelta, category="financial", impact="medium", companies=None) -> NewsItem:
+    item = NewsItem(
+        title="Notícia", summary="Resumo", url=f"https://example.com/{random.random()}",
+        source="InfoMoney", category=category, impact_score=impact, companies=companies,
+        location_name="São Paulo", latitude=-23.55, longitude=-46.63,
+        published_at=datetime.now() - age
+    )
+    db.add(item)
+    db.commit()
+    return item
+
+def add_random_news(db, count: int, rng: random.Random, max_age: timedelta):
+    for _ in range(count):
+        tickers = rng.sample(TICKERS, rng.randint(0, 2))
+        add_news(
+            db,
+            # Whole minutes, so some items share published_at
+            age=timedelta(minutes=rng.randint(1, int(max_age.total_seconds() // 60))),
+            category=rng.choice(CATEGORIES),
+            impact=rng.choice(IMPACTS),
+            companies=",".join(tickers) or None
+        )
+
+def ids(items):
+    return [item.id for item in items]
+
+def assert_matches_db(store, db, **filters):
+    """The store may decline (None), but an answer must equal the DB's"""
+    records = store.query(**filters)
+    if records is not None:
+        assert ids(records) == ids(query_recent_news(db, **filters)), filters
+    return records
+
+FILTER_COMBOS = [
+    dict(limit=limit, category=category, impact=impact, ticker=ticker)
+    for limit, category, impact, ticker in itertools.product(
+        [1, 5, 100], [None] + CATEGORIES, [None] + IMPACTS, [None, "PETR4", "B3", "b3sa3"]
+    )
+]
+
+def test_not_ready_declines(db):
+    add_news(db, timedelta(minutes=5))
+    assert HotNewsStore(hours=24, max_items=100).query() is None
+
+def test_complete_store_matches_db(db):
+    add_random_news(db, 60, random.Random(1), timedelta(hours=23))
+    store = HotNewsStore(hours=24, max_items=100)
+    store.refresh()
+
+    assert store.complete
+    for filters in FILTER_COMBOS:
+        assert assert_matches_db(store, db, **filters) is not None
+
+def test_cap_eviction(db):
+    add_random_news(db, 30, random.Random(2), timedelta(hours=23))
+    store = HotNewsStore(hours=24, max_items=10)
+    store.refresh()
+
+    assert len(store.records) == 10
+    assert not store.complete
+    # The newest items are still answered from memory...
+    assert assert_matches_db(store, db, limit=5) is not None
+    # ...but anything that may reach past the cap goes to the DB
+    assert store.query(limit=20) is None
+    for filters in FILTER_COMBOS:
+        assert_matches_db(store, db, **filters)
+
+def test_window_eviction(db):
+    add_news(db, timedelta(hours=2))
+    recent = add_news(db, timedelta(minutes=10))
+    store = HotNewsStore(hours=1, max_items=100)
+    store.refresh()
+
+    assert ids(store.records.values()) == [recent.id]
+    assert not store.complete
+    assert store.query(limit=100) is None
+    assert ids(store.query(limit=1)) == [recent.id]
+
+def test_items_age_out(db):
+    add_news(db, timedelta(minutes=40))
+    newer = add_news(db, timedelta(minutes=10))
+    store = HotNewsStore(hours=1, max_items=100)
+    store.refresh()
+    assert store.complete
+
+    # As if 30 minutes had passed
+    store.window = timedelta(minutes=30)
+    assert store.query(limit=100) is None
+    assert ids(store.query(limit=1)) == [newer.id]
+    for filters in FILTER_COMBOS:
+        assert_matches_db(store, db, **filters)
+
+def test_refresh_picks_up_other_process_inserts(db):
+    add_random_news(db, 20, random.Random(3), timedelta(hours=23))
+    store = HotNewsStore(hours=24, max_items=100)
+    store.refresh()
+
+    # Inserted by another API process: never passed to store.add
+    other = SessionLocal()
+    try:
+        add_random_news(other, 20, random.Random(4), timedelta(hours=23))
+        fresh_id = add_news(other, timedelta(seconds=1), companies="PETR4").id
+    finally:
+        other.close()
+
+    assert fresh_id not in store.records
+    store.refresh()
+    assert fresh_id in store.records
+    assert store.complete
+    for filters in FILTER_COMBOS:
+        assert assert_matches_db(store, db, **filters) is not None
+
+def test_complete_flips_with_db_contents(db):
+    add_news(db, timedelta(minutes=5))
+    store = HotNewsStore(hours=24, max_items=100)
+    store.refresh()
+    assert store.complete
+
+    old = add_news(db, timedelta(hours=30))
+    store.refresh()
+    assert not store.complete
+    assert store.query(limit=100) is None
+
+    db.delete(old)
+    db.commit()
+    store.refresh()
+    assert store.complete
+    assert assert_matches_db(store, db, limit=100) is not None
+
+def test_add_is_visible_before_refresh(db):
+    store = HotNewsStore(hours=24, max_items=100)
+    store.refresh()
+
+    item = add_news(db, timedelta(seconds=1), impact="high", companies="VALE3")
+    store.add(item)
+    assert ids(store.query(ticker="VALE3")) == [item.id]
+    store.refresh()
+    assert len(store.records) == 1
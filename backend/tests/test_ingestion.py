@@ -0,0 +1,46 @@
+import asyncio
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.services import ingestion, rss_scraper
+
+@pytest.fixture(autouse=True)
+def reset_status(monkeypatch):
+    monkeypatch.setattr(ingestion, "ingestion_status", dict(ingestion.ingestion_status))
+    monkeypatch.setattr("app.main.ingestion_status", ingestion.ingestion_status)
+    ingestion.ingestion_status.update(initial_fetch_complete=False, last_fetch_error=None)
+
+def run_fetch(monkeypatch, fetch_all_feeds):
+    monkeypatch.setattr(rss_scraper, "fetch_all_feeds", fetch_all_feeds)
+    asyncio.run(ingestion.fetch_real_news(ingestion.manager))
+
+def test_failed_fetch_is_not_ready(monkeypatch):
+    async def failing():
+        raise ConnectionError("feeds down")
+    run_fetch(monkeypatch, failing)
+
+    response = TestClient(app).get("/ready", params={"wait_for_fetch": True})
+    assert response.status_code == 503
+    assert response.json()["status"] == "fetch_failed"
+    assert "feeds down" in response.json()["last_fetch_error"]
+
+def test_empty_fetch_is_not_ready(monkeypatch):
+    async def empty():
+        return []
+    run_fetch(monkeypatch, empty)
+
+    assert not ingestion.ingestion_status["initial_fetch_complete"]
+    assert ingestion.ingestion_status["last_fetch_error"]
+
+def test_successful_fetch_is_ready(monkeypatch):
+    async def one_item():
+        return [rss_scraper.RawNewsItem(
+            title="Selic fica estável", summary="Copom mantém juros", url="https://example.com/selic",
+            source="InfoMoney", category="financial", published=None
+        )]
+    run_fetch(monkeypatch, one_item)
+
+    response = TestClient(app).get("/ready", params={"wait_for_fetch": True})
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+    assert response.json()["last_fetch_error"] is None